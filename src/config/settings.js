@@ -0,0 +1,44 @@
+/**
+ * Lightweight environment-backed settings for the orchestration agent.
+ * Values are read straight from process.env with sensible defaults and frozen
+ * into plain objects, so touching configuration never pulls a validation
+ * framework onto the startup path. The entry point is responsible for loading
+ * .env (via dotenv) before this module is first required.
+ */
+const settings = Object.freeze({
+  env: process.env.NODE_ENV || 'development',
+  port: parseInt(process.env.ORCHESTRATOR_PORT, 10) || 3000,
+  logLevel: process.env.LOG_LEVEL || 'info',
+
+  n8n: Object.freeze({
+    protocol: process.env.N8N_PROTOCOL || 'http',
+    host: process.env.N8N_HOST || 'localhost',
+    port: parseInt(process.env.N8N_PORT, 10) || 5678,
+    apiKey: process.env.N8N_API_KEY,
+    webhookUrl: process.env.N8N_WEBHOOK_URL
+  }),
+
+  vercel: Object.freeze({
+    token: process.env.VERCEL_TOKEN,
+    projectId: process.env.VERCEL_PROJECT_ID,
+    teamId: process.env.VERCEL_TEAM_ID
+  }),
+
+  langGraph: Object.freeze({
+    endpoint: process.env.LANGGRAPH_ENDPOINT || 'https://api.langgraph.com',
+    apiKey: process.env.LANGGRAPH_API_KEY
+  }),
+
+  github: Object.freeze({
+    owner: process.env.GITHUB_OWNER,
+    repo: process.env.GITHUB_REPO,
+    webhookSecret: process.env.GITHUB_WEBHOOK_SECRET
+  }),
+
+  notifications: Object.freeze({
+    slackWebhookUrl: process.env.SLACK_WEBHOOK_URL,
+    emailApiKey: process.env.EMAIL_SERVICE_API_KEY
+  })
+});
+
+module.exports = settings;
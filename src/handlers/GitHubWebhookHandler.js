@@ -1,4 +1,5 @@
 const crypto = require('crypto');
+const settings = require('../config/settings');
 const logger = require('../utils/logger');
 
 /**
@@ -7,7 +8,7 @@ const logger = require('../utils/logger');
  */
 class GitHubWebhookHandler {
   constructor() {
-    this.secret = process.env.GITHUB_WEBHOOK_SECRET;
+    this.secret = settings.github.webhookSecret;
     this.orchestrator = null; // Will be injected
   }
 
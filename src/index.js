@@ -1,22 +1,48 @@
 const express = require('express');
-const winston = require('winston');
-const cron = require('node-cron');
 require('dotenv').config();
 
-const WorkflowOrchestrator = require('./orchestrator/WorkflowOrchestrator');
-const GitHubWebhookHandler = require('./handlers/GitHubWebhookHandler');
-const N8nIntegration = require('./integrations/N8nIntegration');
-const VercelIntegration = require('./integrations/VercelIntegration');
+const integrations = require('./integrations');
+const settings = require('./config/settings');
 const logger = require('./utils/logger');
 
+// How long a /health services snapshot may be served before re-checking
+const HEALTH_SNAPSHOT_TTL_MS = 1000;
+
 class AiCanWorkflowAgent {
   constructor() {
     this.app = express();
-    this.port = process.env.ORCHESTRATOR_PORT || 3000;
-    this.orchestrator = new WorkflowOrchestrator();
+    this.port = settings.port;
+    this._orchestrator = null;
+    this._githubWebhookHandler = null;
+    this._healthSnapshot = null;
+    this._healthCheckInFlight = false;
+    this._healthFailureStreak = 0;
+    this.healthCheckTask = null;
+    this.server = null;
     this.setupMiddleware();
     this.setupRoutes();
-    this.startHealthChecks();
+  }
+
+  // Lazy accessor so that constructing the agent (or handling requests that
+  // never touch workflows) does not pay for loading the orchestrator and its
+  // integration modules.
+  get orchestrator() {
+    if (!this._orchestrator) {
+      const WorkflowOrchestrator = require('./orchestrator/WorkflowOrchestrator');
+      this._orchestrator = new WorkflowOrchestrator();
+    }
+    return this._orchestrator;
+  }
+
+  // Built on the first GitHub webhook, so the handler module is never loaded
+  // for deployments that only use n8n or manual triggers.
+  get githubWebhookHandler() {
+    if (!this._githubWebhookHandler) {
+      const GitHubWebhookHandler = require('./handlers/GitHubWebhookHandler');
+      this._githubWebhookHandler = new GitHubWebhookHandler();
+      this._githubWebhookHandler.orchestrator = this.orchestrator;
+    }
+    return this._githubWebhookHandler;
   }
 
   setupMiddleware() {
@@ -41,16 +67,12 @@ class AiCanWorkflowAgent {
         status: 'healthy',
         timestamp: new Date().toISOString(),
         version: process.env.npm_package_version || '1.0.0',
-        services: {
-          orchestrator: this.orchestrator.isHealthy(),
-          n8n: N8nIntegration.isHealthy(),
-          vercel: VercelIntegration.isHealthy()
-        }
+        services: this.getServicesSnapshot()
       });
     });
 
     // GitHub webhooks
-    this.app.post('/webhooks/github', GitHubWebhookHandler.handle.bind(GitHubWebhookHandler));
+    this.app.post('/webhooks/github', (req, res) => this.githubWebhookHandler.handle(req, res));
 
     // n8n webhooks
     this.app.post('/webhooks/n8n/:workflowId', async (req, res) => {
@@ -86,42 +108,103 @@ class AiCanWorkflowAgent {
     });
   }
 
+  // Load balancers and dashboards can probe /health at high frequency while
+  // the per-service status changes rarely; serve a cached snapshot within a
+  // short TTL instead of re-walking every service on each probe.
+  getServicesSnapshot() {
+    const now = Date.now();
+    if (this._healthSnapshot && now - this._healthSnapshot.checkedAt < HEALTH_SNAPSHOT_TTL_MS) {
+      return this._healthSnapshot.services;
+    }
+
+    const services = {
+      orchestrator: this.orchestrator.isHealthy(),
+      n8n: integrations.N8nIntegration.isHealthy(),
+      vercel: integrations.VercelIntegration.isHealthy()
+    };
+    this._healthSnapshot = { checkedAt: now, services };
+    return services;
+  }
+
   startHealthChecks() {
-    // Health check every 5 minutes
-    cron.schedule('*/5 * * * *', () => {
+    const cron = require('node-cron');
+
+    // Health check every 5 minutes; keep the handle so shutdown can stop it
+    this.healthCheckTask = cron.schedule('*/5 * * * *', () => {
       this.performHealthCheck();
     });
   }
 
   async performHealthCheck() {
+    // The cron trigger fires on a fixed period regardless of how long the
+    // previous sweep took; if one stalls past the interval, skip the
+    // overlapping run instead of stacking concurrent sweeps.
+    if (this._healthCheckInFlight) {
+      logger.warn('Previous health check still in flight, skipping this run');
+      return;
+    }
+    this._healthCheckInFlight = true;
+
     try {
+      // Probe the orchestrator's own integration instances concurrently —
+      // they carry the live connection state, and a throwing or slow check
+      // marks that service unhealthy instead of aborting the whole sweep.
+      const [n8nResult, vercelResult] = await Promise.allSettled([
+        this.orchestrator.n8n.healthCheck(),
+        this.orchestrator.vercel.healthCheck()
+      ]);
+
+      for (const [service, result] of [['n8n', n8nResult], ['vercel', vercelResult]]) {
+        if (result.status === 'rejected') {
+          logger.error(`Health check for ${service} threw:`, result.reason);
+        }
+      }
+
       const checks = {
-        n8n: await N8nIntegration.healthCheck(),
-        vercel: await VercelIntegration.healthCheck(),
+        n8n: n8nResult.status === 'fulfilled' ? n8nResult.value : false,
+        vercel: vercelResult.status === 'fulfilled' ? vercelResult.value : false,
         orchestrator: this.orchestrator.isHealthy()
       };
 
       logger.info('Health check completed', checks);
 
-      // Alert if any service is unhealthy
-      const unhealthyServices = Object.entries(checks)
-        .filter(([service, healthy]) => !healthy)
-        .map(([service]) => service);
+      // Alert if any service is unhealthy; collect names in one pass instead
+      // of building intermediate entry/filter arrays.
+      const unhealthyServices = [];
+      for (const [service, healthy] of Object.entries(checks)) {
+        if (!healthy) {
+          unhealthyServices.push(service);
+        }
+      }
 
       if (unhealthyServices.length > 0) {
-        logger.error('Unhealthy services detected:', unhealthyServices);
-        await this.orchestrator.handleServiceFailure(unhealthyServices);
+        // During a long outage every sweep finds the same failure; escalate
+        // on the first hit and then at doubling streaks (1, 2, 4, 8, ...)
+        // instead of re-notifying every interval.
+        this._healthFailureStreak += 1;
+        const streak = this._healthFailureStreak;
+        if ((streak & (streak - 1)) === 0) {
+          logger.error('Unhealthy services detected:', unhealthyServices);
+          await this.orchestrator.handleServiceFailure(unhealthyServices);
+        } else {
+          logger.warn(`Unhealthy services still failing (streak ${streak}):`, unhealthyServices);
+        }
+      } else {
+        this._healthFailureStreak = 0;
       }
     } catch (error) {
       logger.error('Health check failed:', error);
+    } finally {
+      this._healthCheckInFlight = false;
     }
   }
 
   async start() {
     try {
       await this.orchestrator.initialize();
-      
-      this.app.listen(this.port, () => {
+      this.startHealthChecks();
+
+      this.server = this.app.listen(this.port, () => {
         logger.info(`AiCan Workflow Orchestration Agent started on port ${this.port}`);
       });
 
@@ -137,6 +220,18 @@ class AiCanWorkflowAgent {
 
   async shutdown() {
     logger.info('Shutting down AiCan Workflow Agent...');
+
+    // Stop background work first so no health check or incoming request
+    // races the orchestrator teardown.
+    if (this.healthCheckTask) {
+      this.healthCheckTask.stop();
+      this.healthCheckTask = null;
+    }
+    if (this.server) {
+      await new Promise(resolve => this.server.close(resolve));
+      this.server = null;
+    }
+
     await this.orchestrator.shutdown();
     process.exit(0);
   }
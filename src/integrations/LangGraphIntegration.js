@@ -1,16 +1,35 @@
-const axios = require('axios');
+const settings = require('../config/settings');
 const logger = require('../utils/logger');
 
+// Upper bound on memoized error analyses kept per integration instance
+const ERROR_ANALYSIS_CACHE_SIZE = 64;
+
+// Word-boundary patterns for context keys, compiled once and reused across
+// condition evaluations instead of building a fresh RegExp per key per call.
+const identifierPatterns = new Map();
+
+function identifierPattern(key) {
+  let pattern = identifierPatterns.get(key);
+  if (!pattern) {
+    pattern = new RegExp(`\\b${key}\\b`, 'g');
+    identifierPatterns.set(key, pattern);
+  }
+  return pattern;
+}
+
 /**
  * LangGraph Integration for decision flows and stateful workflows
  * Handles AI-powered decision making in workflow orchestration
  */
 class LangGraphIntegration {
   constructor() {
-    this.baseUrl = process.env.LANGGRAPH_ENDPOINT || 'https://api.langgraph.com';
-    this.apiKey = process.env.LANGGRAPH_API_KEY;
+    this.baseUrl = settings.langGraph.endpoint;
+    this.apiKey = settings.langGraph.apiKey;
     this.isReady = false;
     this.graphStore = new Map(); // Local storage for graph definitions
+    this.edgeIndex = new Map(); // graphId -> Map(from node id -> outgoing edges)
+    this.nodeIndex = new Map(); // graphId -> { nodesById, inputNode }
+    this.errorAnalysisCache = new Map(); // error message -> analysis result
   }
 
   async initialize() {
@@ -109,9 +128,42 @@ class LangGraphIntegration {
     ];
 
     graphs.forEach(graph => {
+      // Graph definitions are read-only templates; execution state lives in
+      // the per-run context, so the definitions can be safely frozen.
+      graph.nodes.forEach(Object.freeze);
+      Object.freeze(graph.nodes);
+      if (graph.edges) {
+        graph.edges.forEach(Object.freeze);
+        Object.freeze(graph.edges);
+      }
+      Object.freeze(graph);
+
+      // Pre-index outgoing edges by source node once at load, so traversal
+      // does not re-filter the whole edge list on every step. Graphs without
+      // edges simply index to an empty map and terminate after their input node.
+      const edgesByFrom = new Map();
+      for (const edge of graph.edges || []) {
+        const bucket = edgesByFrom.get(edge.from);
+        if (bucket) {
+          bucket.push(edge);
+        } else {
+          edgesByFrom.set(edge.from, [edge]);
+        }
+      }
+      this.edgeIndex.set(graph.id, edgesByFrom);
+
+      // Graph structure is a fixed template; resolve the node-id lookup table
+      // and entry node once at load instead of rescanning per execution.
+      this.nodeIndex.set(graph.id, {
+        nodesById: new Map(graph.nodes.map(node => [node.id, node])),
+        inputNode: graph.nodes.find(n => n.type === 'input') || null
+      });
+
       this.graphStore.set(graph.id, graph);
-      logger.info(`Loaded decision graph: ${graph.name} (${graph.id})`);
     });
+
+    // One summary line instead of a log write per graph
+    logger.info(`Loaded ${graphs.length} decision graphs: ${graphs.map(g => g.id).join(', ')}`);
   }
 
   async executeDecisionGraph(graphId, input) {
@@ -139,7 +191,8 @@ class LangGraphIntegration {
     // Simple graph processing implementation
     // In production, this would use LangGraph's execution engine
     
-    let currentNode = graph.nodes.find(n => n.type === 'input');
+    const index = this.nodeIndex.get(graph.id);
+    let currentNode = index ? index.inputNode : graph.nodes.find(n => n.type === 'input');
     const executionContext = { ...input };
     const path = [];
 
@@ -230,9 +283,8 @@ class LangGraphIntegration {
       // Replace variables in condition with actual values
       let evaluableCondition = condition;
       for (const [key, value] of Object.entries(context)) {
-        const regex = new RegExp(`\\b${key}\\b`, 'g');
         const replacementValue = typeof value === 'string' ? `"${value}"` : value;
-        evaluableCondition = evaluableCondition.replace(regex, replacementValue);
+        evaluableCondition = evaluableCondition.replace(identifierPattern(key), replacementValue);
       }
       
       // Basic evaluation (in production, use a proper expression evaluator)
@@ -244,18 +296,30 @@ class LangGraphIntegration {
   }
 
   getNextNode(graph, currentNode, context) {
-    const edges = graph.edges.filter(e => e.from === currentNode.id);
-    
+    const edgesByFrom = this.edgeIndex.get(graph.id);
+    const edges = (edgesByFrom && edgesByFrom.get(currentNode.id)) || [];
+    const index = this.nodeIndex.get(graph.id);
+
     for (const edge of edges) {
       if (!edge.condition || this.evaluateCondition(edge.condition, context)) {
-        return graph.nodes.find(n => n.id === edge.to);
+        return index ? index.nodesById.get(edge.to) : graph.nodes.find(n => n.id === edge.to);
       }
     }
-    
+
     return null;
   }
 
-  async analyzeError(error) {
+  async analyzeError(error, forceRefresh = false) {
+    // Identical errors repeat in bursts (retry loops, recurring health-check
+    // failures); reuse the prior analysis instead of re-running the graph.
+    const cacheKey = String(error.message || error);
+    if (!forceRefresh) {
+      const cached = this.errorAnalysisCache.get(cacheKey);
+      if (cached) {
+        return cached;
+      }
+    }
+
     try {
       const result = await this.executeDecisionGraph('error-recovery', {
         errorType: this.detectErrorType(error),
@@ -263,6 +327,12 @@ class LangGraphIntegration {
         severity: this.assessErrorSeverity(error)
       });
 
+      // Bound the cache; evict the oldest entry once full
+      if (this.errorAnalysisCache.size >= ERROR_ANALYSIS_CACHE_SIZE) {
+        this.errorAnalysisCache.delete(this.errorAnalysisCache.keys().next().value);
+      }
+      this.errorAnalysisCache.set(cacheKey, result);
+
       return result;
     } catch (graphError) {
       logger.error('Error analysis failed:', graphError);
@@ -339,6 +409,9 @@ class LangGraphIntegration {
     logger.info('Shutting down LangGraph integration...');
     this.isReady = false;
     this.graphStore.clear();
+    this.edgeIndex.clear();
+    this.nodeIndex.clear();
+    this.errorAnalysisCache.clear();
   }
 }
 
@@ -1,23 +1,30 @@
 const axios = require('axios');
+const settings = require('../config/settings');
 const logger = require('../utils/logger');
 
+// How long a fetched workflow listing may be served before re-fetching
+const WORKFLOW_LIST_TTL_MS = 5 * 60 * 1000;
+
 /**
  * n8n Integration for workflow automation
  * Handles communication with n8n instance for workflow execution
  */
 class N8nIntegration {
   constructor() {
-    this.baseUrl = `${process.env.N8N_PROTOCOL || 'http'}://${process.env.N8N_HOST || 'localhost'}:${process.env.N8N_PORT || 5678}`;
-    this.apiKey = process.env.N8N_API_KEY;
-    this.webhookUrl = process.env.N8N_WEBHOOK_URL;
+    this.baseUrl = `${settings.n8n.protocol}://${settings.n8n.host}:${settings.n8n.port}`;
+    this.apiKey = settings.n8n.apiKey;
+    this.webhookUrl = settings.n8n.webhookUrl;
     this.isReady = false;
+    this.workflowCache = null;
+    this.workflowCacheTime = 0;
   }
 
   async initialize() {
     try {
       logger.info('Initializing n8n integration...');
-      await this.healthCheck();
-      await this.loadWorkflows();
+      // Health probe and workflow listing are independent calls; run them
+      // concurrently so startup waits for the slower of the two, not the sum.
+      await Promise.all([this.healthCheck(), this.loadWorkflows()]);
       this.isReady = true;
       logger.info('n8n integration initialized successfully');
     } catch (error) {
@@ -38,7 +45,14 @@ class N8nIntegration {
     }
   }
 
-  async loadWorkflows() {
+  async loadWorkflows(forceRefresh = false) {
+    // The workflow listing is slowly-changing configuration data; serve the
+    // cached copy within the TTL instead of a round trip per caller. Create/
+    // update/delete below invalidate the cache explicitly.
+    if (!forceRefresh && this.workflowCache && Date.now() - this.workflowCacheTime < WORKFLOW_LIST_TTL_MS) {
+      return this.workflowCache;
+    }
+
     try {
       const response = await axios.get(`${this.baseUrl}/api/v1/workflows`, {
         headers: this.getAuthHeaders(),
@@ -47,7 +61,10 @@ class N8nIntegration {
 
       const workflows = response.data.data || response.data;
       logger.info(`Loaded ${workflows.length} n8n workflows`);
-      
+
+      this.workflowCache = workflows;
+      this.workflowCacheTime = Date.now();
+
       return workflows;
     } catch (error) {
       logger.error('Failed to load n8n workflows:', error.message);
@@ -155,6 +172,7 @@ class N8nIntegration {
       );
 
       logger.info(`Created n8n workflow: ${workflowDefinition.name} (${response.data.id})`);
+      this.workflowCache = null;
       return response.data;
     } catch (error) {
       logger.error('Failed to create n8n workflow:', error.message);
@@ -174,6 +192,7 @@ class N8nIntegration {
       );
 
       logger.info(`Updated n8n workflow: ${workflowId}`);
+      this.workflowCache = null;
       return response.data;
     } catch (error) {
       logger.error(`Failed to update n8n workflow ${workflowId}:`, error.message);
@@ -189,6 +208,7 @@ class N8nIntegration {
       });
 
       logger.info(`Deleted n8n workflow: ${workflowId}`);
+      this.workflowCache = null;
       return true;
     } catch (error) {
       logger.error(`Failed to delete n8n workflow ${workflowId}:`, error.message);
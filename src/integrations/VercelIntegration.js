@@ -1,4 +1,5 @@
 const axios = require('axios');
+const settings = require('../config/settings');
 const logger = require('../utils/logger');
 
 /**
@@ -8,17 +9,18 @@ const logger = require('../utils/logger');
 class VercelIntegration {
   constructor() {
     this.baseUrl = 'https://api.vercel.com';
-    this.token = process.env.VERCEL_TOKEN;
-    this.projectId = process.env.VERCEL_PROJECT_ID;
-    this.teamId = process.env.VERCEL_TEAM_ID;
+    this.token = settings.vercel.token;
+    this.projectId = settings.vercel.projectId;
+    this.teamId = settings.vercel.teamId;
     this.isReady = false;
   }
 
   async initialize() {
     try {
       logger.info('Initializing Vercel integration...');
-      await this.healthCheck();
-      await this.loadProjectInfo();
+      // The health probe and project lookup are independent API calls; overlap
+      // them so initialization latency is the max of the two, not the sum.
+      await Promise.all([this.healthCheck(), this.loadProjectInfo()]);
       this.isReady = true;
       logger.info('Vercel integration initialized successfully');
     } catch (error) {
@@ -103,7 +105,7 @@ class VercelIntegration {
       name: `aican-${environment}`,
       gitSource: {
         type: 'github',
-        repo: `${process.env.GITHUB_OWNER}/${process.env.GITHUB_REPO}`,
+        repo: `${settings.github.owner}/${settings.github.repo}`,
         ref: context.branch || 'main'
       },
       projectSettings: {
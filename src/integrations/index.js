@@ -0,0 +1,26 @@
+/**
+ * Integration package facade with lazy module loading.
+ * Each integration is required on first property access, so consumers that
+ * only need one integration do not pay for loading the others.
+ */
+const lazyModules = {
+  N8nIntegration: './N8nIntegration',
+  VercelIntegration: './VercelIntegration',
+  LangGraphIntegration: './LangGraphIntegration'
+};
+
+for (const [name, modulePath] of Object.entries(lazyModules)) {
+  Object.defineProperty(module.exports, name, {
+    enumerable: true,
+    configurable: true,
+    get() {
+      const loaded = require(modulePath);
+      // Replace the getter with the resolved module so later accesses are plain
+      Object.defineProperty(module.exports, name, {
+        value: loaded,
+        enumerable: true
+      });
+      return loaded;
+    }
+  });
+}
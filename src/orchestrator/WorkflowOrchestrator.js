@@ -1,9 +1,12 @@
 const { v4: uuidv4 } = require('uuid');
+const { performance } = require('perf_hooks');
 const logger = require('../utils/logger');
-const N8nIntegration = require('../integrations/N8nIntegration');
-const VercelIntegration = require('../integrations/VercelIntegration');
-const LangGraphIntegration = require('../integrations/LangGraphIntegration');
-const NotificationService = require('../services/NotificationService');
+
+// Upper bound on retained jobs; oldest finished jobs are evicted beyond this
+const MAX_JOB_HISTORY = 1024;
+
+// How long shutdown waits for in-flight jobs before proceeding anyway
+const SHUTDOWN_JOB_TIMEOUT_MS = 30000;
 
 /**
  * Main orchestrator class that coordinates workflow execution
@@ -11,8 +14,19 @@ const NotificationService = require('../services/NotificationService');
  */
 class WorkflowOrchestrator {
   constructor() {
+    // Required here rather than at module scope so that consumers loading this
+    // module for its definitions only pay for the integration module graphs
+    // when an orchestrator is actually constructed.
+    const N8nIntegration = require('../integrations/N8nIntegration');
+    const VercelIntegration = require('../integrations/VercelIntegration');
+    const LangGraphIntegration = require('../integrations/LangGraphIntegration');
+    const NotificationService = require('../services/NotificationService');
+
     this.workflows = new Map();
+    this.workflowsByName = new Map(); // name and id -> workflow
     this.activeJobs = new Map();
+    this.jobsByWorkflowId = new Map(); // workflowId -> first job for that workflow
+    this.activeLaunches = new Map(); // "workflowId:commit" -> jobId of the running job
     this.isInitialized = false;
     this.n8n = new N8nIntegration();
     this.vercel = new VercelIntegration();
@@ -24,11 +38,14 @@ class WorkflowOrchestrator {
     try {
       logger.info('Initializing Workflow Orchestrator...');
       
-      // Initialize integrations
-      await this.n8n.initialize();
-      await this.vercel.initialize();
-      await this.langGraph.initialize();
-      await this.notifications.initialize();
+      // Initialize integrations concurrently — they have no ordering
+      // dependencies, so startup waits for the slowest one, not the sum.
+      await Promise.all([
+        this.n8n.initialize(),
+        this.vercel.initialize(),
+        this.langGraph.initialize(),
+        this.notifications.initialize()
+      ]);
 
       // Load workflow definitions
       await this.loadWorkflowDefinitions();
@@ -84,9 +101,19 @@ class WorkflowOrchestrator {
     ];
 
     workflows.forEach(workflow => {
+      // Definitions are static records shared across jobs; freezing keeps
+      // their shape stable and guards against accidental per-job mutation.
+      workflow.steps.forEach(Object.freeze);
+      Object.freeze(workflow.steps);
+      Object.freeze(workflow);
+
       this.workflows.set(workflow.id, workflow);
-      logger.info(`Loaded workflow: ${workflow.name} (${workflow.id})`);
+      this.workflowsByName.set(workflow.id, workflow);
+      this.workflowsByName.set(workflow.name, workflow);
     });
+
+    // One summary line instead of a log write per definition
+    logger.info(`Loaded ${workflows.length} workflow definitions: ${workflows.map(w => w.id).join(', ')}`);
   }
 
   async triggerWorkflow(workflowName, context = {}) {
@@ -96,24 +123,67 @@ class WorkflowOrchestrator {
         throw new Error(`Workflow not found: ${workflowName}`);
       }
 
+      // Webhook redeliveries and overlapping triggers can launch the same
+      // workflow for the same commit twice; while such a run is still active,
+      // return it instead of fanning out duplicate deployments.
+      const launchKey = context.commit_sha ? `${workflow.id}:${context.commit_sha}` : null;
+      if (launchKey) {
+        const runningJob = this.activeJobs.get(this.activeLaunches.get(launchKey));
+        if (runningJob && runningJob.status === 'running') {
+          logger.warn(`Workflow ${workflow.name} already running for commit ${context.commit_sha} (job: ${runningJob.id})`);
+          return {
+            jobId: runningJob.id,
+            workflowId: workflow.id,
+            status: 'already_running',
+            message: `Workflow ${workflow.name} is already running for this commit`
+          };
+        }
+      }
+
       const jobId = uuidv4();
       const job = {
         id: jobId,
         workflowId: workflow.id,
-        context,
+        // Copied once so step results can be merged in place without
+        // mutating the caller's object or re-copying context per step
+        context: { ...context },
         status: 'running',
         startTime: new Date(),
+        // Monotonic start mark for duration measurement; wall-clock startTime
+        // stays for display and is subject to clock adjustments.
+        startMark: performance.now(),
+        launchKey,
         steps: [],
-        currentStep: 0
+        currentStep: 0,
+        // Declared up front (instead of being added as execution progresses)
+        // so every job record keeps a single stable object shape
+        endTime: null,
+        error: null,
+        n8nResult: null,
+        execution: null
       };
 
       this.activeJobs.set(jobId, job);
+      if (!this.jobsByWorkflowId.has(workflow.id)) {
+        this.jobsByWorkflowId.set(workflow.id, job);
+      }
+      if (launchKey) {
+        this.activeLaunches.set(launchKey, jobId);
+      }
+      this.pruneJobHistory();
       logger.info(`Started workflow: ${workflow.name} (job: ${jobId})`);
 
-      // Execute workflow asynchronously
-      this.executeWorkflow(job, workflow).catch(error => {
+      // Execute workflow asynchronously; the settled promise is kept on the
+      // job so shutdown can wait for in-flight work.
+      job.execution = this.executeWorkflow(job, workflow).catch(async error => {
         logger.error(`Workflow execution failed: ${jobId}`, error);
-        this.handleWorkflowError(job, error);
+        try {
+          await this.handleWorkflowError(job, error);
+        } catch (handlerError) {
+          // Cleanup must never mask the original failure or surface as an
+          // unhandled rejection; the job is already marked failed above.
+          logger.error(`Error handling failed for job ${jobId}:`, handlerError);
+        }
       });
 
       return {
@@ -132,8 +202,11 @@ class WorkflowOrchestrator {
     try {
       logger.info(`Executing workflow: ${workflow.name} (job: ${job.id})`);
 
-      for (let i = 0; i < workflow.steps.length; i++) {
-        const step = workflow.steps[i];
+      // Hoisted out of the loop: the step list is fixed for the whole run
+      const steps = workflow.steps;
+
+      for (let i = 0; i < steps.length; i++) {
+        const step = steps[i];
         job.currentStep = i;
 
         // Check step condition if exists
@@ -152,28 +225,39 @@ class WorkflowOrchestrator {
           timestamp: new Date()
         });
 
-        // Update job context with step result
-        job.context = { ...job.context, ...stepResult };
+        // Update job context with step result (merged in place; the context
+        // object is owned by the job, so no per-step full copy is needed)
+        Object.assign(job.context, stepResult);
       }
 
       job.status = 'completed';
       job.endTime = new Date();
-      
+      this.releaseLaunchKey(job);
+
       logger.info(`Workflow completed successfully: ${workflow.name} (job: ${job.id})`);
-      await this.notifications.send('workflow_completed', {
+      this.notifyInBackground('workflow_completed', {
         workflowName: workflow.name,
         jobId: job.id,
-        duration: job.endTime - job.startTime
+        duration: Math.round(performance.now() - job.startMark)
       });
 
     } catch (error) {
       job.status = 'failed';
       job.error = error.message;
       job.endTime = new Date();
+      this.releaseLaunchKey(job);
       throw error;
     }
   }
 
+  // Free the launch guard once a job is no longer running, so the next
+  // trigger for the same workflow+commit may start a fresh run.
+  releaseLaunchKey(job) {
+    if (job.launchKey && this.activeLaunches.get(job.launchKey) === job.id) {
+      this.activeLaunches.delete(job.launchKey);
+    }
+  }
+
   async executeStep(step, context) {
     switch (step.action) {
       case 'run_tests':
@@ -342,15 +426,27 @@ class WorkflowOrchestrator {
     job.status = 'failed';
     job.error = error.message;
     job.endTime = new Date();
+    this.releaseLaunchKey(job);
 
-    // Send error notification
-    await this.notifications.send('workflow_error', {
+    // Send error notification off the critical path
+    this.notifyInBackground('workflow_error', {
       jobId: job.id,
       workflowId: job.workflowId,
       error: error.message
     });
   }
 
+  // Dispatch a notification without blocking the caller. Completion and
+  // error notices are informational — nothing downstream depends on the
+  // delivery result — so failures are logged rather than propagated.
+  notifyInBackground(type, data) {
+    // Promise.resolve tolerates send implementations (or test mocks) that
+    // return a plain value instead of a promise.
+    Promise.resolve(this.notifications.send(type, data)).catch(error => {
+      logger.error(`Background notification ${type} failed:`, error);
+    });
+  }
+
   async handleServiceFailure(unhealthyServices) {
     logger.error('Service failure detected:', unhealthyServices);
     
@@ -360,12 +456,46 @@ class WorkflowOrchestrator {
     });
   }
 
+  // Finished jobs are kept around for status queries, but the map must not
+  // grow without bound over a long-lived process. Once the cap is exceeded,
+  // evict the oldest completed/failed jobs (Map preserves insertion order);
+  // running jobs are never evicted.
+  pruneJobHistory() {
+    if (this.activeJobs.size <= MAX_JOB_HISTORY) {
+      return;
+    }
+
+    for (const [jobId, job] of this.activeJobs) {
+      if (job.status === 'running') {
+        continue;
+      }
+
+      this.activeJobs.delete(jobId);
+      if (this.jobsByWorkflowId.get(job.workflowId) === job) {
+        // The evicted job was the indexed one; re-point the index at the
+        // oldest surviving job for this workflow so lookups keep finding
+        // newer jobs instead of going empty.
+        this.jobsByWorkflowId.delete(job.workflowId);
+        for (const survivor of this.activeJobs.values()) {
+          if (survivor.workflowId === job.workflowId) {
+            this.jobsByWorkflowId.set(job.workflowId, survivor);
+            break;
+          }
+        }
+      }
+
+      if (this.activeJobs.size <= MAX_JOB_HISTORY) {
+        break;
+      }
+    }
+  }
+
   getWorkflowByName(name) {
-    return Array.from(this.workflows.values()).find(w => w.name === name || w.id === name);
+    return this.workflowsByName.get(name);
   }
 
   findJobByWorkflowId(workflowId) {
-    return Array.from(this.activeJobs.values()).find(j => j.workflowId === workflowId);
+    return this.jobsByWorkflowId.get(workflowId);
   }
 
   async getWorkflowStatus(workflowId) {
@@ -393,17 +523,31 @@ class WorkflowOrchestrator {
   async shutdown() {
     logger.info('Shutting down Workflow Orchestrator...');
     
-    // Wait for active jobs to complete or timeout
-    const activeJobIds = Array.from(this.activeJobs.keys());
-    if (activeJobIds.length > 0) {
-      logger.info(`Waiting for ${activeJobIds.length} active jobs to complete...`);
-      // In a real implementation, you'd want to gracefully stop jobs
+    // Wait for all in-flight jobs together (not one by one) with a timeout,
+    // so shutdown latency is bounded by the slowest job or the deadline.
+    const runningJobs = Array.from(this.activeJobs.values()).filter(j => j.status === 'running');
+    if (runningJobs.length > 0) {
+      logger.info(`Waiting for ${runningJobs.length} active jobs to complete...`);
+      await Promise.race([
+        Promise.allSettled(runningJobs.map(j => j.execution)),
+        new Promise(resolve => setTimeout(resolve, SHUTDOWN_JOB_TIMEOUT_MS).unref())
+      ]);
     }
 
-    await this.n8n.shutdown();
-    await this.vercel.shutdown();
-    await this.langGraph.shutdown();
-    await this.notifications.shutdown();
+    // Shut integrations down concurrently; one failing shutdown must not
+    // block or mask the others, so collect and log failures afterwards.
+    const results = await Promise.allSettled([
+      this.n8n.shutdown(),
+      this.vercel.shutdown(),
+      this.langGraph.shutdown(),
+      this.notifications.shutdown()
+    ]);
+
+    for (const result of results) {
+      if (result.status === 'rejected') {
+        logger.error('Integration shutdown failed:', result.reason);
+      }
+    }
   }
 }
 
@@ -1,6 +1,10 @@
 const axios = require('axios');
+const settings = require('../config/settings');
 const logger = require('../utils/logger');
 
+// Default delivery targets, shared across calls instead of re-allocated per send
+const DEFAULT_CHANNELS = Object.freeze(['console']);
+
 /**
  * Notification Service for sending alerts and updates
  * Supports multiple notification channels (Slack, Email, etc.)
@@ -16,14 +20,14 @@ class NotificationService {
       logger.info('Initializing Notification Service...');
       
       // Initialize Slack if configured
-      if (process.env.SLACK_WEBHOOK_URL) {
-        this.channels.set('slack', new SlackChannel(process.env.SLACK_WEBHOOK_URL));
+      if (settings.notifications.slackWebhookUrl) {
+        this.channels.set('slack', new SlackChannel(settings.notifications.slackWebhookUrl));
         logger.info('Slack notifications enabled');
       }
 
       // Initialize Email if configured
-      if (process.env.EMAIL_SERVICE_API_KEY) {
-        this.channels.set('email', new EmailChannel(process.env.EMAIL_SERVICE_API_KEY));
+      if (settings.notifications.emailApiKey) {
+        this.channels.set('email', new EmailChannel(settings.notifications.emailApiKey));
         logger.info('Email notifications enabled');
       }
 
@@ -38,7 +42,7 @@ class NotificationService {
     }
   }
 
-  async send(type, data, channels = ['console']) {
+  async send(type, data, channels = DEFAULT_CHANNELS) {
     if (!this.isReady) {
       logger.warn('Notification Service not ready, skipping notification');
       return;
@@ -46,25 +50,35 @@ class NotificationService {
 
     try {
       const message = this.buildMessage(type, data);
-      const results = [];
 
-      for (const channelName of channels) {
+      // Deliver to all channels concurrently; each send captures its own
+      // outcome, so one slow or failing channel neither delays nor masks the
+      // others, and results keep the channel order of the input list.
+      const results = await Promise.all(channels.map(async channelName => {
         const channel = this.channels.get(channelName);
-        if (channel) {
-          try {
-            const result = await channel.send(message);
-            results.push({ channel: channelName, success: true, result });
-            logger.info(`Notification sent via ${channelName}:`, message.title);
-          } catch (error) {
-            logger.error(`Failed to send notification via ${channelName}:`, error);
-            results.push({ channel: channelName, success: false, error: error.message });
-          }
-        } else {
+        if (!channel) {
           logger.warn(`Notification channel not found: ${channelName}`);
+          return null;
         }
-      }
 
-      return results;
+        try {
+          const result = await channel.send(message);
+          return { channel: channelName, success: true, result };
+        } catch (error) {
+          logger.error(`Failed to send notification via ${channelName}:`, error);
+          return { channel: channelName, success: false, error: error.message };
+        }
+      }));
+
+      const delivered = results.filter(Boolean);
+
+      // One structured summary record instead of a log write per channel
+      logger.info(`Notification dispatched: ${message.title}`, {
+        channels: delivered.map(r => r.channel),
+        failed: delivered.filter(r => !r.success).length
+      });
+
+      return delivered;
     } catch (error) {
       logger.error('Failed to send notification:', error);
       throw error;
@@ -72,6 +86,9 @@ class NotificationService {
   }
 
   buildMessage(type, data) {
+    // One clock read per message; every branch below stamps the same instant.
+    const timestamp = new Date().toISOString();
+
     switch (type) {
       case 'workflow_completed':
         return {
@@ -80,7 +97,7 @@ class NotificationService {
           details: {
             'Job ID': data.jobId,
             'Duration': `${Math.round(data.duration / 1000)}s`,
-            'Timestamp': new Date().toISOString()
+            'Timestamp': timestamp
           },
           color: 'good',
           priority: 'info'
@@ -94,7 +111,7 @@ class NotificationService {
             'Job ID': data.jobId,
             'Workflow ID': data.workflowId,
             'Error': data.error,
-            'Timestamp': new Date().toISOString()
+            'Timestamp': timestamp
           },
           color: 'danger',
           priority: 'high'
@@ -109,7 +126,7 @@ class NotificationService {
             'URL': data.preview_url || data.staging_url || data.production_url,
             'Deployment ID': data.deployment_id,
             'Status': 'Success',
-            'Timestamp': new Date().toISOString()
+            'Timestamp': timestamp
           },
           color: 'good',
           priority: 'info'
@@ -135,7 +152,7 @@ class NotificationService {
           details: {
             'Reason': data.error || 'Unknown',
             'Context': JSON.stringify(data.context || {}),
-            'Timestamp': new Date().toISOString()
+            'Timestamp': timestamp
           },
           color: 'warning',
           priority: 'high'
@@ -149,7 +166,7 @@ class NotificationService {
             'Repository': data.repository,
             'Branch': data.branch,
             'Commit': data.commit_sha?.substring(0, 8),
-            'Timestamp': new Date().toISOString()
+            'Timestamp': timestamp
           },
           color: 'good',
           priority: 'info'
@@ -164,7 +181,7 @@ class NotificationService {
             'Error': data.error,
             'Deployment ID': data.deployment_id,
             'Repository': data.repository,
-            'Timestamp': new Date().toISOString()
+            'Timestamp': timestamp
           },
           color: 'danger',
           priority: 'high'
@@ -46,6 +46,43 @@ describe('WorkflowOrchestrator', () => {
         orchestrator.triggerWorkflow('unknown-workflow', {})
       ).rejects.toThrow('Workflow not found: unknown-workflow');
     });
+
+    test('should reuse the running job for repeat triggers with the same commit', async () => {
+      // Hold the first step open so the initial job stays running while the
+      // duplicate trigger arrives; later steps complete immediately.
+      let releaseFirstStep;
+      jest.spyOn(orchestrator, 'executeStep')
+        .mockResolvedValue({})
+        .mockImplementationOnce(() => new Promise(resolve => {
+          releaseFirstStep = resolve;
+        }));
+
+      const first = await orchestrator.triggerWorkflow('ci-cd-pipeline', {
+        commit_sha: 'abc1234'
+      });
+      const second = await orchestrator.triggerWorkflow('ci-cd-pipeline', {
+        commit_sha: 'abc1234'
+      });
+
+      expect(first.status).toBe('started');
+      expect(second).toMatchObject({
+        jobId: first.jobId,
+        workflowId: 'ci-cd-pipeline',
+        status: 'already_running'
+      });
+
+      // Let the held job finish and verify the guard is released
+      releaseFirstStep({});
+      await orchestrator.activeJobs.get(first.jobId).execution;
+      expect(orchestrator.activeJobs.get(first.jobId).status).toBe('completed');
+
+      const third = await orchestrator.triggerWorkflow('ci-cd-pipeline', {
+        commit_sha: 'abc1234'
+      });
+      expect(third.status).toBe('started');
+      expect(third.jobId).not.toBe(first.jobId);
+      await orchestrator.activeJobs.get(third.jobId).execution;
+    });
   });
 
   describe('Step Execution', () => {
@@ -1,5 +1,4 @@
 // Test setup file for Jest
-const path = require('path');
 
 // Set test environment variables
 process.env.NODE_ENV = 'test';